@@ -1,28 +1,403 @@
 import arxiv
+import asyncio
+import functools
+import hashlib
 import os
 import json
-from typing import List
+import operator
+import re
+import string
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+from xml.etree import ElementTree
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; without it the stdlib `json` module is used with matching output.
+    orjson = None
+
+try:
+    import httpx
+except ImportError:
+    # httpx is optional; it is only needed by `search_papers_async`.
+    httpx = None
 
 # Global constant for the base directory where topic-specific paper subdirectories are stored.
 PAPER_DIR = "."
 
+# Name of the per-topic file holding paper metadata, one JSON object per line (JSON Lines).
+PAPERS_FILENAME = "papers_info.jsonl"
+# Name of the single-JSON-list file used before the JSON Lines format; migrated on first access.
+_LEGACY_PAPERS_FILENAME = "papers_info.json"
+# Name of the per-topic sidecar listing the stored entry_ids, one per line, so the index
+# can be rebuilt without decoding any paper metadata.
+_IDS_FILENAME = "ids.txt"
+
+# In-memory index used by `extract_info` to avoid re-reading every topic file on each lookup.
+# `_ID_INDEX` maps a paper's entry_id to the `papers_info.jsonl` paths that contain it (the
+# same paper is often saved under several topics), `_FILE_MTIME` records the (mtime in ns,
+# size) each file had when it was last indexed, and `_FILE_IDS` keeps the entry_ids indexed
+# from each file so they can be dropped on change.
+_ID_INDEX: Dict[str, Set[str]] = {}
+_FILE_MTIME: Dict[str, Tuple[int, int]] = {}
+_FILE_IDS: Dict[str, Set[str]] = {}
+
+# Shared arXiv client. Reusing it across searches keeps its HTTP session (and the pooled
+# keep-alive connection to export.arxiv.org) open, so only the first search pays for DNS
+# and the TLS handshake. It also lets the client's rate limiting span consecutive calls.
+_ARXIV_CLIENT = arxiv.Client(page_size=100, num_retries=3)
+
+# Name of the per-topic folder caching search results, one file per (topic, max_results).
+_QUERY_CACHE_DIRNAME = "query_cache"
+# How long cached search results are reused; arXiv publishes new papers once a day.
+QUERY_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Translation table lowercasing ASCII letters and turning spaces into underscores, used to
+# sanitize topic names into directory names in one pass.
+_SANITIZE_TABLE = str.maketrans({**{c: c.lower() for c in string.ascii_uppercase}, ' ': '_'})
+
+# Attribute getters used by `_paper_metadata` to read `arxiv.Result` fields.
+_GET_PAPER_FIELDS = operator.attrgetter('title', 'summary', 'pdf_url', 'entry_id', 'published', 'authors')
+_GET_NAME = operator.attrgetter('name')
+
+# arXiv Atom API endpoint queried directly by `search_papers_async`.
+ARXIV_API_URL = "https://export.arxiv.org/api/query"
+# arXiv asks API clients to start at most one request every 3 seconds; the async path spaces
+# its requests accordingly (the arxiv library's client does the same for the sync path).
+ARXIV_REQUEST_DELAY_SECONDS = 3.0
+# How many times the async path retries a request rejected as rate-limited or unavailable.
+ARXIV_NUM_RETRIES = 3
+# HTTP statuses the arXiv API answers with when a request should simply be retried later.
+_RETRYABLE_STATUSES = {429, 503}
+# XML namespace of the Atom elements in the arXiv API's responses.
+_ATOM_NS = {"atom": "http://www.w3.org/2005/Atom"}
+
+def _json_loads(data: bytes):
+    """Decodes JSON bytes, using orjson's C parser when it is available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj, indent: bool = False) -> bytes:
+    """
+    Encodes `obj` as UTF-8 JSON bytes, using orjson when it is available.
+
+    With `indent=True` the output is pretty-printed with a 2-space indent (the only
+    indent orjson supports); otherwise it is compact. The stdlib fallback is configured
+    to produce byte-for-byte the same layout.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode()
+
+def _migrate_legacy_file(directory_path: str) -> bool:
+    """
+    Converts a topic folder's legacy `papers_info.json` list into `papers_info.jsonl`.
+
+    Nothing happens if the folder has no legacy file or already has a JSON Lines file.
+    The new file is written to a temporary sibling and swapped in with `os.replace`
+    before the legacy file is removed, so an interrupted migration loses nothing.
+
+    Returns:
+        True if a legacy file was migrated, False otherwise.
+    """
+    legacy_path = os.path.join(directory_path, _LEGACY_PAPERS_FILENAME)
+    filepath = os.path.join(directory_path, PAPERS_FILENAME)
+    if os.path.exists(filepath):
+        return False
+
+    try:
+        # Opening the legacy file directly doubles as the existence check.
+        with open(legacy_path, 'rb') as f:
+            papers_data = _json_loads(f.read())
+    except FileNotFoundError:
+        return False
+    except json.JSONDecodeError:
+        # Leave a corrupted legacy file in place for manual inspection.
+        print(f"Warning: Could not decode JSON from {legacy_path}. File may be corrupted. Not migrating.")
+        return False
+
+    # The legacy file is expected to contain a list of paper metadata dictionaries.
+    if not isinstance(papers_data, list):
+        print(f"Warning: Data in {legacy_path} is not a list. Not migrating.")
+        return False
+
+    tmp_filepath = filepath + ".tmp"
+    with open(tmp_filepath, 'wb') as f:
+        f.write(b"".join(_json_dumps(paper) + b"\n" for paper in papers_data))
+    os.replace(tmp_filepath, filepath)
+    os.remove(legacy_path)
+    return True
+
+def _scan_entry_ids(filepath: str) -> Set[str]:
+    """
+    Reads a `papers_info.jsonl` file line by line and collects the entry_ids it holds.
+
+    Lines that cannot be decoded (e.g. a record torn by an interrupted append) are
+    reported and skipped, so one bad line does not hide the rest of the topic.
+    """
+    ids = set()
+    try:
+        with open(filepath, 'rb') as f:
+            for line_number, line in enumerate(f, start=1):
+                # Tolerate blank lines, e.g. a trailing newline added after a torn record.
+                if not line.strip():
+                    continue
+                try:
+                    paper_metadata = _json_loads(line)
+                except json.JSONDecodeError:
+                    print(f"Warning: Could not decode line {line_number} of {filepath}. Line may be corrupted. Skipping.")
+                    continue
+                if isinstance(paper_metadata, dict) and 'entry_id' in paper_metadata:
+                    ids.add(paper_metadata['entry_id'])
+    except FileNotFoundError:
+        # The file was removed after it was stat'ed; treat it as empty.
+        pass
+    except Exception as e:
+        # Catch any other unexpected errors during file reading.
+        print(f"Warning: An unexpected error occurred while reading {filepath}: {e}. Skipping.")
+    return ids
+
+def _write_entry_ids(ids_path: str, ids: Set[str]) -> None:
+    """
+    Atomically replaces a topic's `ids.txt` sidecar with the given set of entry_ids.
+
+    IDs are written sorted, so rebuilding the sidecar yields the same file regardless of
+    set iteration order.
+    """
+    tmp_ids_path = ids_path + ".tmp"
+    with open(tmp_ids_path, 'w') as f:
+        f.write("".join(entry_id + "\n" for entry_id in sorted(ids)))
+    os.replace(tmp_ids_path, ids_path)
+
+def _file_stamp(filepath: str) -> Tuple[int, int]:
+    """
+    Returns the (mtime in ns, size) of a file, from a single stat call.
+
+    The size catches appends that land within the same mtime tick as the previous write,
+    which the mtime alone misses on filesystems with coarse timestamps.
+    """
+    st = os.stat(filepath)
+    return st.st_mtime_ns, st.st_size
+
+def _load_entry_ids(filepath: str, stamp: Tuple[int, int]) -> Set[str]:
+    """
+    Returns the entry_ids stored in a `papers_info.jsonl` file whose (mtime, size) is `stamp`.
+
+    The topic's `ids.txt` sidecar is used when it is at least as new as the papers file
+    and ends with a complete line; otherwise the papers file is scanned and the sidecar
+    is rebuilt from the result for the next reader.
+    """
+    ids_path = os.path.join(os.path.dirname(filepath), _IDS_FILENAME)
+    try:
+        # Open first and take the mtime from the open descriptor, so the existence check,
+        # freshness check and read share a single path lookup.
+        with open(ids_path, 'r') as f:
+            if os.fstat(f.fileno()).st_mtime_ns >= stamp[0]:
+                content = f.read()
+                # A sidecar torn by an interrupted write is not trusted.
+                if not content or content.endswith("\n"):
+                    # Blank lines are not IDs.
+                    return {line for line in content.splitlines() if line.strip()}
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        # An unreadable sidecar (e.g. no permission, or not valid text) is ignored in
+        # favor of scanning the papers file.
+        print(f"Warning: Could not read {ids_path}: {e}. Rebuilding it from {filepath}.")
+
+    ids = _scan_entry_ids(filepath)
+    try:
+        _write_entry_ids(ids_path, ids)
+    except OSError as e:
+        # The sidecar is only an optimization; the index is still correct without it.
+        print(f"Warning: Could not write {ids_path}: {e}.")
+    return ids
+
+def _forget_file(filepath: str) -> None:
+    """Drops a topic file and every entry_id indexed from it from the in-memory index."""
+    _FILE_MTIME.pop(filepath, None)
+    for stale_id in _FILE_IDS.pop(filepath, ()):
+        paths = _ID_INDEX.get(stale_id)
+        if paths is not None:
+            paths.discard(filepath)
+            # Keep the ID indexed as long as another topic file still holds it.
+            if not paths:
+                del _ID_INDEX[stale_id]
+
+def _index_file(filepath: str, stamp: Tuple[int, int]) -> Set[str]:
+    """
+    (Re-)indexes a topic file whose (mtime, size) differs from the recorded one.
+
+    Returns:
+        The set of entry_ids stored in the file.
+    """
+    return _set_file_ids(filepath, stamp, _load_entry_ids(filepath, stamp))
+
+def _set_file_ids(filepath: str, stamp: Tuple[int, int], ids: Set[str]) -> Set[str]:
+    """
+    Replaces the IDs indexed from a topic file with `ids`, loaded when its (mtime, size) was `stamp`.
+
+    The stamp is recorded even for unreadable files so they are not re-read
+    (and re-warned about) until they change on disk.
+    """
+    # Forget the IDs previously indexed from this file before adding the fresh ones.
+    _forget_file(filepath)
+    _FILE_MTIME[filepath] = stamp
+    _FILE_IDS[filepath] = ids
+    for entry_id in ids:
+        _ID_INDEX.setdefault(entry_id, set()).add(filepath)
+    return ids
+
+def _stored_entry_ids(filepath: str) -> Set[str]:
+    """
+    Returns the entry_ids stored in a topic file, re-reading it only if it changed on disk.
+
+    The returned set is shared with the index and must not be mutated by callers.
+    """
+    try:
+        stamp = _file_stamp(filepath)
+    except FileNotFoundError:
+        # No saved papers for this topic (yet).
+        _forget_file(filepath)
+        return set()
+    if _FILE_MTIME.get(filepath) == stamp:
+        return _FILE_IDS[filepath]
+    return _index_file(filepath, stamp)
+
+def _record_appended(filepath: str, new_entry_ids: Set[str]) -> None:
+    """Adds IDs just appended to a topic file to the index and records the file's new (mtime, size)."""
+    _FILE_IDS.setdefault(filepath, set()).update(new_entry_ids)
+    _FILE_MTIME[filepath] = _file_stamp(filepath)
+    for entry_id in new_entry_ids:
+        _ID_INDEX.setdefault(entry_id, set()).add(filepath)
+
+def _append_papers(filepath: str, papers: List[dict]) -> None:
+    """
+    Appends paper metadata records to a `papers_info.jsonl` file in a single write.
+
+    Existing records are never rewritten, so the cost of saving is proportional to the
+    number of new papers rather than to the size of the file. If a previous append was
+    interrupted and left the file without a trailing newline, one is written first so
+    the torn record does not swallow the new ones.
+    """
+    payload = b"".join(_json_dumps(paper) + b"\n" for paper in papers)
+    with open(filepath, 'a+b') as f:
+        # In append mode writes always go to the end; seeking only affects the read below.
+        if f.seek(0, os.SEEK_END) > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                payload = b"\n" + payload
+        f.write(payload)
+
+def _paper_metadata(paper: arxiv.Result) -> dict:
+    """Extracts the metadata stored for a paper from an `arxiv.Result`."""
+    # Fetch all needed attributes with one C-level attrgetter call instead of one lookup each.
+    title, summary, pdf_url, entry_id, published, authors = _GET_PAPER_FIELDS(paper)
+    return {
+        "title": title,
+        "authors": list(map(_GET_NAME, authors)), # Author names, looked up by attrgetter
+        "summary": summary,
+        "pdf_url": pdf_url,
+        "published_date": published.isoformat()[:10], # YYYY-MM-DD, without going through strftime
+        "entry_id": entry_id
+    }
+
+def _query_cache_path(directory_path: str, topic: str, max_results: int,
+                      bulk_topics: Optional[List[str]] = None) -> str:
+    """
+    Returns the path of the cached results for a search, keyed by (topic, max_results).
+
+    A topic's share of a combined multi-topic search (`bulk_topics`) is also keyed by the
+    full topic list, so it never stands in for a plain single-topic search.
+    """
+    key_source = f"{topic}|{max_results}"
+    if bulk_topics is not None and len(bulk_topics) > 1:
+        key_source += "|bulk:" + _json_dumps(sorted(bulk_topics)).decode()
+    cache_key = hashlib.sha1(key_source.encode()).hexdigest()
+    return os.path.join(directory_path, _QUERY_CACHE_DIRNAME, f"{cache_key}.json")
+
+def _load_cached_query(cache_path: str) -> Optional[List[dict]]:
+    """
+    Returns the cached metadata of a search's results, in result order.
+
+    Returns None if there is no cache file, if it is older than QUERY_CACHE_TTL_SECONDS,
+    or if it cannot be read, in which case the search has to be run against arXiv.
+    """
+    try:
+        # Open first and check the age on the open descriptor: one path lookup, no stat-then-open race.
+        with open(cache_path, 'rb') as f:
+            if time.time() - os.fstat(f.fileno()).st_mtime > QUERY_CACHE_TTL_SECONDS:
+                return None
+            cached = _json_loads(f.read())
+    except FileNotFoundError:
+        return None
+    except json.JSONDecodeError:
+        print(f"Warning: Could not decode JSON from {cache_path}. Ignoring the cached results.")
+        return None
+    if not isinstance(cached, dict) or not isinstance(cached.get("papers"), list):
+        print(f"Warning: Unexpected data in {cache_path}. Ignoring the cached results.")
+        return None
+    return cached["papers"]
+
+def _cached_results(topics: List[str], max_results_each: int, bulk_topics: Optional[List[str]] = None):
+    """
+    Looks up the cached search results of each topic, optionally as part of the combined
+    search of `bulk_topics` (see `_query_cache_path`).
+
+    Reuses the results of the same search made within the last day, if there is one;
+    arXiv only publishes new papers once a day, so repeating the request sooner is wasted.
+
+    Returns:
+        A tuple of a dict mapping each topic with fresh cached results to their metadata,
+        and the list of the remaining topics, which have to be searched on arXiv.
+    """
+    results_by_topic = {}
+    uncached_topics = []
+    for topic in topics:
+        cached = _load_cached_query(_query_cache_path(_topic_directory(topic), topic, max_results_each, bulk_topics))
+        if cached is None:
+            uncached_topics.append(topic)
+        else:
+            results_by_topic[topic] = cached
+    return results_by_topic, uncached_topics
+
+def _save_cached_query(cache_path: str, results_metadata: List[dict]) -> None:
+    """Atomically writes the metadata of a search's results to its cache file."""
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    cached = {
+        "entry_ids": [metadata["entry_id"] for metadata in results_metadata],
+        "papers": results_metadata,
+    }
+    tmp_cache_path = cache_path + ".tmp"
+    with open(tmp_cache_path, 'wb') as f:
+        f.write(_json_dumps(cached))
+    os.replace(tmp_cache_path, cache_path)
+
 def search_papers(topic: str, max_results: int = 5) -> List[str]:
     """
     Searches arXiv for papers related to a specific topic and stores their metadata locally.
 
-    The function creates a directory named after the sanitized topic (lowercase, spaces
-    replaced with underscores). Inside this directory, it saves paper metadata in a
-    JSON file named `papers_info.json`.
+    The function creates a directory under PAPER_DIR named after the sanitized topic
+    (lowercase, spaces replaced with underscores). Inside this directory, it saves paper
+    metadata in a JSON Lines file named `papers_info.jsonl`, one paper per line, and the
+    stored entry_ids in an `ids.txt` sidecar. A `papers_info.json` list left by older
+    versions is migrated to this format first.
 
-    If `papers_info.json` already exists, the function loads the existing data.
-    It then performs a new search on arXiv. For each paper found, it checks if the
-    paper's `entry_id` is already present in the loaded data. If not, the new paper's
+    The function then performs a new search on arXiv, unless the same search (topic and
+    max_results) was made within the last QUERY_CACHE_TTL_SECONDS, in which case its
+    results are read from the topic's `query_cache` folder instead. For each paper
+    found, it checks if the paper's `entry_id` is already stored for the topic. If not, the new paper's
     metadata (title, authors, summary, PDF URL, published date, and entry_id) is
-    appended to the list. This ensures that duplicates are not added if the search
-    is run multiple times for the same topic.
-
-    The updated list of metadata is then saved back to `papers_info.json`.
-    The function prints the absolute path to this JSON file.
+    appended to `papers_info.jsonl`. This ensures that duplicates are not added if the
+    search is run multiple times for the same topic. Existing lines are never rewritten,
+    and nothing is written at all when the search turns up no new papers.
+    The function prints the absolute path to this JSON Lines file. It is the
+    single-topic case of `search_papers_bulk`.
 
     Args:
         topic: The topic to search for on arXiv (e.g., "Quantum Computing").
@@ -34,85 +409,378 @@ def search_papers(topic: str, max_results: int = 5) -> List[str]:
         *current* search. This list may include IDs already stored if they
         appeared in the current search results.
     """
+    return search_papers_bulk([topic], max_results)[topic]
+
+@functools.lru_cache(maxsize=128)
+def _sanitize_topic(topic: str) -> str:
+    """
+    Sanitizes a topic string into a directory name: lowercase, spaces replaced with underscores.
+
+    ASCII topics (the common case) are converted in a single `str.translate` pass; other
+    topics use the full Unicode-aware `str.lower`. Results are cached for repeated topics.
+    """
+    if topic.isascii():
+        return topic.translate(_SANITIZE_TABLE)
+    return topic.lower().replace(" ", "_")
+
+def _topic_directory(topic: str) -> str:
+    """Returns the folder under PAPER_DIR where a topic's papers are stored."""
     # Sanitize the topic string to create a valid directory name.
     # Example: "Quantum Computing" -> "quantum_computing"
-    directory_name = topic.lower().replace(" ", "_")
+    return os.path.join(PAPER_DIR, _sanitize_topic(topic))
 
-    # Create the directory for the topic if it doesn't already exist.
-    # `exist_ok=True` prevents an error if the directory already exists.
-    os.makedirs(directory_name, exist_ok=True)
+def _tokens(text: str) -> Set[str]:
+    """Splits text into the set of its lowercase words, for topic matching."""
+    return set(re.findall(r"\w+", text.lower()))
 
-    # Construct the full path to the JSON file where paper metadata will be stored.
-    filepath = os.path.join(directory_name, "papers_info.json")
+def _fetch_results(topics: List[str], max_results_each: int) -> Dict[str, List[dict]]:
+    """
+    Runs a single arXiv search covering all `topics` and splits the results per topic.
 
-    # Load existing paper metadata from the JSON file if it exists.
-    all_papers_metadata = []
-    if os.path.exists(filepath):
-        try:
-            with open(filepath, 'r') as f:
-                loaded_data = json.load(f)
-                # Ensure the loaded data is a list, as expected.
-                if isinstance(loaded_data, list):
-                    all_papers_metadata = loaded_data
-                else:
-                    # Handle cases where the JSON file does not contain a list (e.g., corrupted or wrong format).
-                    print(f"Warning: Data in {filepath} is not a list. Starting with an empty list of papers.")
-        except json.JSONDecodeError:
-            # Handle cases where the JSON file is corrupted or not valid JSON.
-            print(f"Warning: Could not decode JSON from {filepath}. File might be corrupted. Starting with an empty list of papers.")
-        except Exception as e:
-            # Catch any other unexpected errors during file loading.
-            print(f"Warning: An unexpected error occurred while loading {filepath}: {e}. Starting with an empty list of papers.")
+    Several topics are combined into one `(t1) OR (t2) OR ...` query asking for
+    `max_results_each` results per topic. Each result is assigned to the topic whose
+    words overlap most with the paper's title and summary. A result is discarded if
+    that topic already has `max_results_each` papers or if it shares no words with any
+    topic, so a topic never receives papers matching another topic better; topics may
+    therefore end up with fewer than `max_results_each` papers. A single topic is
+    searched for as-is and keeps every result.
 
-    # This list will store the entry_ids of papers found in the *current* search.
-    current_search_paper_ids = []
-    # Create a set of entry_ids from already stored papers for efficient duplicate checking.
-    existing_entry_ids = {p['entry_id'] for p in all_papers_metadata if 'entry_id' in p}
+    Returns:
+        A dict mapping each topic to the metadata of its papers, in result order.
+    """
+    if len(topics) == 1:
+        query = topics[0]
+    else:
+        query = " OR ".join(f"({topic})" for topic in topics)
 
-    # Initialize the arXiv client and perform the search.
-    # `arxiv.Client()` is used to interact with the arXiv API.
+    # Perform the search with the shared arXiv client.
     # `arxiv.Search()` configures the search query and parameters.
-    client = arxiv.Client()
-    search = arxiv.Search(query=topic, max_results=max_results)
+    client = _ARXIV_CLIENT
+    search = arxiv.Search(query=query, max_results=max_results_each * len(topics))
+    results_by_topic = {topic: [] for topic in topics}
+    topic_tokens = {topic: _tokens(topic) for topic in topics}
     # `client.results(search)` executes the search and returns an iterable of Paper objects.
     # This usage addresses a DeprecationWarning from older versions of the arxiv library.
-    results = list(client.results(search))
+    # The generator is consumed directly, so papers are processed as each page arrives
+    # and the full result list is never held in memory.
+    for paper in client.results(search):
+        if len(topics) == 1:
+            best_topic = topics[0]
+        else:
+            paper_tokens = _tokens(f"{paper.title} {paper.summary}")
+            # `max` returns the first of equally good topics, so ties keep the callers' order.
+            best_topic = max(topics, key=lambda topic: len(topic_tokens[topic] & paper_tokens))
+            if not topic_tokens[best_topic] & paper_tokens:
+                # Matches none of the topics.
+                continue
+        if len(results_by_topic[best_topic]) < max_results_each:
+            # Extract the paper's metadata into a dictionary.
+            results_by_topic[best_topic].append(_paper_metadata(paper))
+    return results_by_topic
+
+def _save_results(topic: str, results_metadata: List[dict]) -> List[str]:
+    """
+    Stores the papers of a topic's search results that are not saved for the topic yet.
+
+    Returns:
+        The entry_ids of all papers in `results_metadata`, in order.
+    """
+    directory_path = _topic_directory(topic)
+
+    # Create the directory for the topic if it doesn't already exist.
+    # `exist_ok=True` prevents an error if the directory already exists.
+    os.makedirs(directory_path, exist_ok=True)
+    # Convert a papers_info.json list written by an older version, if there is one.
+    _migrate_legacy_file(directory_path)
+
+    # Construct the full path to the JSON Lines file where paper metadata will be stored.
+    filepath = os.path.join(directory_path, PAPERS_FILENAME)
+
+    # The entry_ids already stored for this topic, for efficient duplicate checking.
+    # The file is only re-read if it changed since it was last seen by this process.
+    existing_entry_ids = _stored_entry_ids(filepath)
+
+    # This list will store the entry_ids of papers found in the *current* search.
+    current_search_paper_ids = []
+    # Metadata of papers not stored yet, and their IDs to avoid duplicates from *this* search session.
+    new_papers_metadata = []
+    new_entry_ids = set()
 
     # Process each paper found in the current search.
-    for paper in results:
-        paper_entry_id = paper.entry_id
+    for metadata in results_metadata:
+        paper_entry_id = metadata["entry_id"]
         current_search_paper_ids.append(paper_entry_id) # Keep track of all IDs from this specific search
 
         # Add the paper to our stored list only if its entry_id is not already present.
         # This prevents duplicates if the same paper is fetched in multiple searches.
-        if paper_entry_id not in existing_entry_ids:
-            # If the paper is new, extract its metadata into a dictionary.
-            metadata = {
-                "title": paper.title,
-                "authors": [author.name for author in paper.authors], # List comprehension to get author names
-                "summary": paper.summary,
-                "pdf_url": paper.pdf_url,
-                "published_date": paper.published.strftime('%Y-%m-%d'), # Format date as YYYY-MM-DD
-                "entry_id": paper_entry_id
-            }
-            all_papers_metadata.append(metadata) # Add new paper's metadata to our main list
-            existing_entry_ids.add(paper_entry_id)  # Add its ID to the set to avoid duplicates from *this* search session
-
-    # Save the potentially updated list of all paper metadata back to the JSON file.
-    # `indent=4` makes the JSON file human-readable.
-    with open(filepath, 'w') as f:
-        json.dump(all_papers_metadata, f, indent=4)
-
-    # Print the absolute path to the JSON file for user confirmation.
+        if paper_entry_id not in existing_entry_ids and paper_entry_id not in new_entry_ids:
+            new_papers_metadata.append(metadata) # Queue the new paper's metadata for saving
+            new_entry_ids.add(paper_entry_id)
+
+    # Append only the new papers to the JSON Lines file; an unchanged topic is not touched.
+    if new_papers_metadata:
+        _append_papers(filepath, new_papers_metadata)
+
+        # Record the new IDs in the sidecar after the papers themselves, so the sidecar is
+        # never newer than papers it does not list. Appending is only safe if the papers file
+        # already existed and the sidecar lists what it stores; otherwise (e.g. a topic reset by
+        # deleting papers_info.jsonl but not ids.txt) the sidecar is rewritten in full.
+        ids_path = os.path.join(directory_path, _IDS_FILENAME)
+        if existing_entry_ids and os.path.exists(ids_path):
+            with open(ids_path, 'a') as f:
+                f.write("".join(entry_id + "\n" for entry_id in sorted(new_entry_ids)))
+        else:
+            _write_entry_ids(ids_path, existing_entry_ids | new_entry_ids)
+
+        # Bring the cached IDs and (mtime, size) up to date, so this process's own append does not
+        # make the next search or lookup re-read the file.
+        _record_appended(filepath, new_entry_ids)
+
+    # Print the absolute path to the JSON Lines file for user confirmation.
     print(f"Results saved to: {os.path.abspath(filepath)}")
 
     # Return the list of paper entry_ids found in the current search session.
     return current_search_paper_ids
 
+def search_papers_bulk(topics: List[str], max_results_each: int = 5) -> Dict[str, List[str]]:
+    """
+    Searches arXiv for papers on several topics at once and stores their metadata locally.
+
+    Behaves like calling `search_papers` for each topic, but all topics without fresh
+    cached results are fetched with a single combined arXiv query (see `_fetch_results`)
+    instead of one request per topic. Results are saved per topic exactly as
+    `search_papers` does, and cached separately from single-topic searches since the
+    combined query returns different papers.
+
+    Args:
+        topics: The topics to search for on arXiv (e.g., ["Quantum Computing", "Machine Learning"]).
+        max_results_each: The maximum number of papers to keep per topic. Defaults to 5.
+
+    Returns:
+        A dict mapping each topic to the list of paper entry_ids found for it in the
+        *current* search.
+    """
+    # Drop repeated topics while keeping the callers' order.
+    topics = list(dict.fromkeys(topics))
+    bulk_topics = topics if len(topics) > 1 else None
+    results_by_topic, uncached_topics = _cached_results(topics, max_results_each, bulk_topics)
+
+    # How results are split depends on every topic of the combined query, so if anything
+    # is missing, fetch all topics again in one request and cache each topic's share.
+    if uncached_topics:
+        fetched = _fetch_results(topics, max_results_each)
+        for topic in topics:
+            cache_path = _query_cache_path(_topic_directory(topic), topic, max_results_each, bulk_topics)
+            _save_cached_query(cache_path, fetched[topic])
+            results_by_topic[topic] = fetched[topic]
+
+    return {topic: _save_results(topic, results_by_topic[topic]) for topic in topics}
+
+def _async_client() -> "httpx.AsyncClient":
+    """
+    Creates the `httpx.AsyncClient` used by one `search_papers_async` call.
+
+    An AsyncClient's pooled connections belong to the event loop they were opened on, so
+    a client is not kept across calls; callers close it with `async with`.
+    """
+    return httpx.AsyncClient(limits=httpx.Limits(max_keepalive_connections=20), timeout=30.0)
+
+def _parse_atom_feed(content: bytes) -> List[dict]:
+    """
+    Extracts the stored metadata of every paper in an arXiv API Atom feed.
+
+    Produces the same fields as `_paper_metadata` does for an `arxiv.Result`, with the
+    title's whitespace collapsed the way the arxiv library does it.
+    """
+    root = ElementTree.fromstring(content)
+    papers_metadata = []
+    for entry in root.iterfind("atom:entry", _ATOM_NS):
+        pdf_urls = [link.get("href") for link in entry.iterfind("atom:link", _ATOM_NS) if link.get("title") == "pdf"]
+        papers_metadata.append({
+            "title": re.sub(r"\s+", " ", entry.findtext("atom:title", "", _ATOM_NS)).strip(),
+            "authors": [author.findtext("atom:name", "", _ATOM_NS) for author in entry.iterfind("atom:author", _ATOM_NS)],
+            "summary": entry.findtext("atom:summary", "", _ATOM_NS).strip(),
+            "pdf_url": pdf_urls[0] if pdf_urls else None,
+            "published_date": entry.findtext("atom:published", "", _ATOM_NS)[:10], # Already YYYY-MM-DDThh:mm:ssZ
+            "entry_id": entry.findtext("atom:id", "", _ATOM_NS)
+        })
+    return papers_metadata
+
+class _RequestThrottle:
+    """Spaces out the start of requests shared across concurrent tasks by a fixed delay."""
+
+    def __init__(self, delay_seconds: float):
+        self._delay_seconds = delay_seconds
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def wait(self) -> None:
+        """Waits until the next request may start, and reserves that slot."""
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            delay = self._next_start - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_start = loop.time() + self._delay_seconds
+
+async def _fetch_topic_async(client: "httpx.AsyncClient", throttle: _RequestThrottle,
+                             topic: str, max_results: int) -> List[dict]:
+    """
+    Runs one arXiv API search for `topic` and returns its papers' metadata, in result order.
+
+    Every attempt waits for its turn on `throttle`. Responses with a 429 or 503 status are
+    retried up to ARXIV_NUM_RETRIES times; any other error status raises `httpx.HTTPStatusError`.
+    """
+    params = {"search_query": topic, "start": 0, "max_results": max_results}
+    for attempt in range(ARXIV_NUM_RETRIES + 1):
+        await throttle.wait()
+        response = await client.get(ARXIV_API_URL, params=params)
+        if response.status_code not in _RETRYABLE_STATUSES or attempt == ARXIV_NUM_RETRIES:
+            break
+    response.raise_for_status()
+    return _parse_atom_feed(response.content)
+
+async def search_papers_async(topics: List[str], max_results_each: int = 5) -> Dict[str, List[str]]:
+    """
+    Searches arXiv for papers on several topics concurrently and stores their metadata locally.
+
+    Behaves like calling `search_papers` for each topic, but the topics without fresh
+    cached results are each searched with their own request to the arXiv Atom API over
+    one `httpx.AsyncClient`, so slow responses overlap instead of adding up. Requests
+    still start at most once every ARXIV_REQUEST_DELAY_SECONDS, as arXiv asks, and
+    rate-limited or unavailable responses are retried. The arxiv library is not used on
+    this path. Results are cached and saved per topic exactly as `search_papers` does.
+    A topic whose search fails is reported and left out, without affecting the others.
+
+    From synchronous code, run it with `asyncio.run(search_papers_async(topics))`.
+
+    Args:
+        topics: The topics to search for on arXiv (e.g., ["Quantum Computing", "Machine Learning"]).
+        max_results_each: The maximum number of search results to fetch per topic. Defaults to 5.
+
+    Returns:
+        A dict mapping each topic that could be searched to the list of paper entry_ids
+        found for it in the *current* search.
+
+    Raises:
+        ImportError: If the optional httpx package is not installed.
+    """
+    if httpx is None:
+        raise ImportError("search_papers_async requires the httpx package.")
+
+    # Drop repeated topics while keeping the callers' order.
+    topics = list(dict.fromkeys(topics))
+    results_by_topic, uncached_topics = _cached_results(topics, max_results_each)
+
+    # Fetch everything else concurrently, then cache the results of each topic that succeeded.
+    if uncached_topics:
+        throttle = _RequestThrottle(ARXIV_REQUEST_DELAY_SECONDS)
+        async with _async_client() as client:
+            fetched = await asyncio.gather(
+                *(_fetch_topic_async(client, throttle, topic, max_results_each) for topic in uncached_topics),
+                return_exceptions=True)
+        for topic, results_metadata in zip(uncached_topics, fetched):
+            if isinstance(results_metadata, Exception):
+                print(f"Warning: Searching arXiv for '{topic}' failed: {results_metadata}. Skipping.")
+                continue
+            _save_cached_query(_query_cache_path(_topic_directory(topic), topic, max_results_each), results_metadata)
+            results_by_topic[topic] = results_metadata
+
+    return {topic: _save_results(topic, results_by_topic[topic]) for topic in topics if topic in results_by_topic}
+
+def _refresh_index() -> None:
+    """
+    Brings the in-memory `entry_id` index up to date with the topic folders under PAPER_DIR.
+
+    Each topic's `papers_info.jsonl` is stat'ed, and only files whose modification time
+    or size differs from the one recorded in `_FILE_MTIME` are re-indexed, from the topic's
+    `ids.txt` sidecar when it is up to date. When several topics changed, their IDs
+    are loaded concurrently on a thread pool. Entries belonging to topic files that
+    changed or disappeared are dropped from `_ID_INDEX` before the fresh IDs are
+    added, so the index never points at stale locations.
+    """
+    # Collect the 'papers_info.jsonl' path and (mtime, size) of every topic folder in one pass.
+    # `os.scandir` yields DirEntry objects whose file type comes from the directory listing
+    # itself, so telling folders apart costs no extra stat call per item.
+    topic_files = {}
+    with os.scandir(PAPER_DIR) as it:
+        for entry in it:
+            # Topic folders are directories; skip plain files (and symlinks).
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            json_path = os.path.join(entry.path, PAPERS_FILENAME)
+            try:
+                # A single stat doubles as the existence check and the (mtime, size) probe.
+                topic_files[json_path] = _file_stamp(json_path)
+            except FileNotFoundError:
+                # No saved papers for this topic (yet), unless it still uses the legacy format.
+                if _migrate_legacy_file(entry.path):
+                    topic_files[json_path] = _file_stamp(json_path)
+
+    # Re-index only the topic files that changed since they were last seen.
+    stale_files = [(json_path, stamp) for json_path, stamp in topic_files.items() if _FILE_MTIME.get(json_path) != stamp]
+    if len(stale_files) > 1:
+        # Loading is I/O-bound (file reads release the GIL), so fan it out over threads;
+        # the index itself is only updated from this thread, below.
+        with ThreadPoolExecutor(max_workers=min(32, len(stale_files))) as executor:
+            loaded_ids = list(executor.map(lambda stale_file: _load_entry_ids(*stale_file), stale_files))
+    else:
+        loaded_ids = [_load_entry_ids(json_path, stamp) for json_path, stamp in stale_files]
+    for (json_path, stamp), ids in zip(stale_files, loaded_ids):
+        _set_file_ids(json_path, stamp, ids)
+
+    # Drop everything indexed from topic files that no longer exist.
+    for gone_path in set(_FILE_MTIME) - topic_files.keys():
+        _forget_file(gone_path)
+
+def _decode_record(data: bytes, position: int) -> Optional[dict]:
+    """Decodes the JSON Lines record on the line of `data` containing byte offset `position`."""
+    line_start = data.rfind(b"\n", 0, position) + 1
+    line_end = data.find(b"\n", position)
+    if line_end == -1:
+        line_end = len(data)
+    try:
+        record = _json_loads(data[line_start:line_end])
+    except json.JSONDecodeError:
+        # A torn or corrupted line.
+        return None
+    return record if isinstance(record, dict) else None
+
+def _find_paper(data: bytes, paper_id: str) -> Optional[dict]:
+    """
+    Finds a paper's record in the raw bytes of a `papers_info.jsonl` file.
+
+    Records are written compactly, so a paper's line contains the exact bytes
+    `"entry_id":"<paper_id>"`. A plain byte search for that needle (a C-level `memmem`)
+    locates the record without decoding any other line, and only the enclosing line is
+    parsed. Lines whose layout differs (e.g. edited by hand) are found by a fallback
+    scan for the bare ID.
+
+    Returns:
+        The paper's metadata dictionary, or None if it is not in `data`.
+    """
+    # An empty ID would make the bare-ID needle empty, which matches everywhere.
+    if not paper_id:
+        return None
+    for needle in (_json_dumps({"entry_id": paper_id})[1:-1], _json_dumps(paper_id)[1:-1]):
+        position = data.find(needle)
+        while position != -1:
+            record = _decode_record(data, position)
+            # Check if this record's 'entry_id' matches the requested 'paper_id'.
+            if record is not None and record.get('entry_id') == paper_id:
+                return record
+            position = data.find(needle, position + len(needle))
+    return None
+
 def extract_info(paper_id: str) -> str:
     """
     Searches all saved paper metadata in topic folders under PAPER_DIR for a specific paper.
 
+    Lookups go through an in-memory index of `entry_id` -> `papers_info.jsonl` paths, which
+    is refreshed lazily (only files modified since the last call are re-read). Only a topic
+    file that holds the paper is then read, and only the line holding the paper's
+    record is decoded (see `_find_paper`).
+
     Args:
         paper_id: The entry_id of the paper to search for.
 
@@ -120,53 +788,27 @@ def extract_info(paper_id: str) -> str:
         A string containing the paper's metadata as a pretty-printed JSON if found,
         otherwise a message indicating the paper was not found.
     """
-    # Iterate through all items (files and directories) in the PAPER_DIR.
-    # PAPER_DIR is expected to contain subdirectories, each named after a topic.
-    for item_name in os.listdir(PAPER_DIR):
-        # Construct the full path for the item.
-        topic_dir_path = os.path.join(PAPER_DIR, item_name)
+    _refresh_index()
 
-        # Check if the current item is a directory; topic folders are directories.
-        if os.path.isdir(topic_dir_path):
-            # Construct the path to the 'papers_info.json' file within this topic directory.
-            json_path = os.path.join(topic_dir_path, "papers_info.json")
+    # O(1) lookup of the topic files that hold this paper, if any; the first readable copy wins.
+    # Iterate over a sorted copy so the answer is deterministic.
+    for json_path in sorted(_ID_INDEX.get(paper_id, ())):
+        try:
+            with open(json_path, 'rb') as f:
+                data = f.read()
+            paper_metadata = _find_paper(data, paper_id)
+            if paper_metadata is not None:
+                # Paper found. Convert the metadata dictionary to a pretty-printed JSON string.
+                # `indent=True` formats the JSON string with a 2-space indent for readability.
+                return _json_dumps(paper_metadata, indent=True).decode()
+        except FileNotFoundError:
+            # The file was removed between refreshing the index and reading it.
+            print(f"Warning: File not found {json_path} (it was removed after being indexed). Skipping.")
+        except Exception as e:
+            # Catch any other unexpected errors during file reading or JSON processing.
+            print(f"Warning: An unexpected error occurred while reading {json_path}: {e}. Skipping.")
 
-            # Check if the 'papers_info.json' file actually exists in this directory.
-            if os.path.exists(json_path):
-                try:
-                    # Attempt to open and load the JSON data from the file.
-                    with open(json_path, 'r') as f:
-                        papers_data = json.load(f)
-
-                    # The JSON file is expected to contain a list of paper metadata dictionaries.
-                    # If it's not a list, print a warning and skip this file.
-                    if not isinstance(papers_data, list):
-                        print(f"Warning: Data in {json_path} is not a list. Skipping.")
-                        continue # Move to the next item in PAPER_DIR
-
-                    # Iterate through each paper's metadata in the loaded list.
-                    for paper_metadata in papers_data:
-                        # Safely access 'entry_id' using .get() to avoid KeyError if 'entry_id' is missing.
-                        # Check if the current paper's 'entry_id' matches the requested 'paper_id'.
-                        if paper_metadata.get('entry_id') == paper_id:
-                            # Paper found. Convert the metadata dictionary to a pretty-printed JSON string.
-                            # `indent=4` ensures the JSON string is formatted with an indent of 4 spaces for readability.
-                            return json.dumps(paper_metadata, indent=4)
-                except json.JSONDecodeError:
-                    # Handle cases where the file is not valid JSON (e.g., corrupted).
-                    print(f"Warning: Could not decode JSON from {json_path}. File may be corrupted. Skipping.")
-                    continue # Move to the next item in PAPER_DIR
-                except FileNotFoundError:
-                    # This case should ideally be caught by `os.path.exists(json_path)` earlier.
-                    # However, it's included for robustness against rare race conditions or unexpected filesystem behavior.
-                    print(f"Warning: File not found {json_path} (unexpected as os.path.exists was true). Skipping.")
-                    continue # Move to the next item in PAPER_DIR
-                except Exception as e:
-                    # Catch any other unexpected errors during file reading or JSON processing.
-                    print(f"Warning: An unexpected error occurred while reading {json_path}: {e}. Skipping.")
-                    continue # Move to the next item in PAPER_DIR
-
-    # If the loop completes without returning, the paper_id was not found in any file.
+    # The paper_id is not in the index (or vanished from its files), so it was not found.
     return f"There's no saved information related to paper {paper_id}."
 
 if __name__ == "__main__":
@@ -202,9 +844,9 @@ if __name__ == "__main__":
     # and old papers can still be extracted
     print(f"\nSearching again for '{topic1}' papers (max 1, new paper expected if available)...")
     # This search will likely find the same paper or a new one.
-    # If it's the same paper, its entry_id will already exist, and it won't be added again to papers_info.json.
+    # If it's the same paper, its entry_id will already exist, and it won't be added again to papers_info.jsonl.
     # If it's a new paper (e.g., if a new paper matching the query became the top result),
-    # its metadata would be appended to papers_info.json.
+    # its metadata would be appended to papers_info.jsonl.
     search_papers(topic=topic1, max_results=1)
 
     if qc_paper_ids: # Try extracting the originally found paper again
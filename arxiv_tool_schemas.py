@@ -1,44 +1,80 @@
 # This file will store the tool schemas for the functions found in arxiv_searcher.py
+#
+# The schemas are generated once, at import time. Parameter names, types, defaults and the
+# return type come from each tool function's signature and type hints, so they cannot drift
+# from the functions themselves; the caller-facing descriptions come from `_DESCRIPTIONS`.
+import inspect
+import typing
+from typing import Callable, Dict, List
 
-search_papers_schema = {
-    "name": "search_papers",
-    "description": "Searches arXiv for papers related to a specific topic and stores their metadata.",
-    "parameters": {
-        "type": "object",
-        "properties": {
-            "topic": {
-                "type": "string",
-                "description": "The topic to search for on arXiv (e.g., 'Quantum Computing')."
-            },
-            "max_results": {
-                "type": "integer",
-                "description": "The maximum number of search results to fetch from arXiv. Defaults to 5."
-            }
-        },
-        "required": ["topic"]
+from arxiv_searcher import search_papers, extract_info
+
+# The functions exposed as tools, in the order their schemas are listed.
+_TOOL_FUNCTIONS: List[Callable] = [search_papers, extract_info]
+
+# Caller-facing descriptions, per tool. Keys are "description" (the tool), "returns" (its
+# result) and the names of all its parameters.
+_DESCRIPTIONS: Dict[str, Dict[str, str]] = {
+    "search_papers": {
+        "description": "Searches arXiv for papers related to a specific topic and stores their metadata.",
+        "topic": "The topic to search for on arXiv (e.g., 'Quantum Computing').",
+        "max_results": "The maximum number of search results to fetch from arXiv. Defaults to 5.",
+        "returns": "A list of paper entry_ids (unique identifiers from arXiv) found in the current search.",
     },
-    "returns": {
-        "type": "array",
-        "items": {"type": "string"},
-        "description": "A list of paper entry_ids (unique identifiers from arXiv) found in the current search."
-    }
+    "extract_info": {
+        "description": "Extracts and returns the metadata of a specific paper if it has been previously saved.",
+        "paper_id": "The entry_id of the paper to search for.",
+        "returns": "A JSON string containing the paper's metadata if found, otherwise a message indicating the paper was not found.",
+    },
+}
+
+# JSON Schema type names for the Python types used in tool signatures.
+_PY_TO_JSON = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    list: "array",
+    dict: "object",
 }
 
-extract_info_schema = {
-    "name": "extract_info",
-    "description": "Extracts and returns the metadata of a specific paper if it has been previously saved.",
-    "parameters": {
-        "type": "object",
-        "properties": {
-            "paper_id": {
-                "type": "string",
-                "description": "The entry_id of the paper to search for."
-            }
+def _json_type(hint) -> dict:
+    """Returns the JSON Schema type of a type hint, e.g. `List[str]` -> array of strings."""
+    origin = typing.get_origin(hint) or hint
+    schema = {"type": _PY_TO_JSON[origin]}
+    args = typing.get_args(hint)
+    if origin is list and args:
+        schema["items"] = _json_type(args[0])
+    return schema
+
+def _build_schema(fn: Callable) -> dict:
+    """Builds the tool schema of a function from its signature, type hints and `_DESCRIPTIONS` entry."""
+    hints = typing.get_type_hints(fn)
+    descriptions = _DESCRIPTIONS[fn.__name__]
+    properties = {}
+    required = []
+    for name, parameter in inspect.signature(fn).parameters.items():
+        properties[name] = {**_json_type(hints[name]), "description": descriptions[name]}
+        if parameter.default is inspect.Parameter.empty:
+            required.append(name)
+    return {
+        "name": fn.__name__,
+        "description": descriptions["description"],
+        "parameters": {
+            "type": "object",
+            "properties": properties,
+            "required": required
         },
-        "required": ["paper_id"]
-    },
-    "returns": {
-        "type": "string",
-        "description": "A JSON string containing the paper's metadata if found, otherwise a message indicating the paper was not found."
+        "returns": {**_json_type(hints["return"]), "description": descriptions["returns"]}
     }
-}
+
+# Tool schemas and the tool name -> function registry, built together in one pass.
+TOOL_SCHEMAS: Dict[str, dict] = {}
+TOOL_REGISTRY: Dict[str, Callable] = {}
+for _fn in _TOOL_FUNCTIONS:
+    TOOL_SCHEMAS[_fn.__name__] = _build_schema(_fn)
+    TOOL_REGISTRY[_fn.__name__] = _fn
+del _fn
+
+search_papers_schema = TOOL_SCHEMAS["search_papers"]
+extract_info_schema = TOOL_SCHEMAS["extract_info"]
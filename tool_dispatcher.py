@@ -4,28 +4,65 @@ Provides a dynamic tool execution mechanism.
 
 This module allows for calling functions (tools) based on a string name.
 Tools are registered in the `TOOL_REGISTRY` dictionary, which maps tool
-names (strings) to their corresponding callable functions.
+names (strings) to their corresponding callable functions. The registry is
+generated by `arxiv_tool_schemas` together with the tools' schemas.
 
 To add a new tool:
-1. Import the tool function.
-2. Add an entry to `TOOL_REGISTRY` with the desired tool name as the key
-   and the function object as the value.
+1. Import the tool function in `arxiv_tool_schemas`.
+2. Add it to `_TOOL_FUNCTIONS` there, and its descriptions to `_DESCRIPTIONS`;
+   its schema and `TOOL_REGISTRY` entry are derived from its signature and type hints.
 
 Main component:
 - `execute_tool(tool_name: str, tool_args: dict)`: Executes a registered tool.
 '''
+import functools
 import json # New import
-from arxiv_searcher import search_papers, extract_info # Assuming arxiv_searcher.py is in the same directory or PYTHONPATH
+import typing
+from typing import Callable
+
+from arxiv_tool_schemas import TOOL_REGISTRY
 
 class ToolNotFoundError(Exception):
     '''Raised when a tool name is not found in the TOOL_REGISTRY.'''
     pass
 
-TOOL_REGISTRY = {
-    "search_papers": search_papers,
-    "extract_info": extract_info,
+def _format_none(result: None) -> str:
+    '''Formats a missing (None) result.'''
+    return "The operation completed but didn't return any results."
+
+def _format_list(result: list) -> str:
+    '''Formats a list result as its comma-separated items.'''
+    return ", ".join(map(str, result))
+
+# Formats a dict result as pretty-printed JSON.
+_format_dict = functools.partial(json.dumps, indent=4)
+
+# Result formatters keyed by the exact type of the result; any other type goes through `str`.
+# A single dict lookup replaces a chain of isinstance checks.
+_FORMATTERS = {
+    type(None): _format_none,
+    list: _format_list,
+    dict: _format_dict,
+    str: str,
 }
 
+def _format_result(result) -> str:
+    '''Formats a tool result according to its type (None, list, dict, other).'''
+    return _FORMATTERS.get(type(result), str)(result)
+
+def _formatter_for(tool_function: Callable) -> Callable:
+    '''
+    Picks the result formatter of a tool from its return annotation, so that
+    `execute_tool` does not have to inspect the type of every result. Tools
+    without a (recognized) return annotation use the general `_format_result`.
+    '''
+    return_hint = typing.get_type_hints(tool_function).get("return")
+    return_type = typing.get_origin(return_hint) or return_hint
+    return _FORMATTERS.get(return_type, _format_result)
+
+# Result formatter of each registered tool, resolved once at import time.
+_RESULT_FORMATTERS = {name: _formatter_for(fn) for name, fn in TOOL_REGISTRY.items()}
+
 def execute_tool(tool_name: str, tool_args: dict):
     '''
     Executes a tool identified by tool_name with specified arguments
@@ -42,17 +79,7 @@ def execute_tool(tool_name: str, tool_args: dict):
     Raises:
         ToolNotFoundError: If the tool_name is not found in TOOL_REGISTRY.
     '''
-    if tool_name in TOOL_REGISTRY:
-        tool_function = TOOL_REGISTRY[tool_name]
-        result = tool_function(**tool_args) # Original result
-
-        if result is None:
-            return "The operation completed but didn't return any results."
-        elif isinstance(result, list):
-            return ", ".join(map(str, result))
-        elif isinstance(result, dict):
-            return json.dumps(result, indent=4)
-        else:
-            return str(result)
-    else:
+    tool_function = TOOL_REGISTRY.get(tool_name)
+    if tool_function is None:
         raise ToolNotFoundError(f"Tool '{tool_name}' not found.")
+    return _RESULT_FORMATTERS[tool_name](tool_function(**tool_args))